@@ -9,7 +9,7 @@ import jax.numpy as jnp
 import numpy as np
 
 from rljax.algorithm.base_class.base_algoirithm import OffPolicyAlgorithm, OnPolicyAlgorithm
-from rljax.util import fake_action, fake_state, load_params, save_params
+from rljax.util import canonicalize_state, fake_action, fake_state, load_params, save_params
 
 
 class ActorCriticMixIn:
@@ -32,8 +32,14 @@ class ActorCriticMixIn:
         return {"key": next(self.rng)} if self.use_key_actor else {}
 
     def select_action(self, state):
-        action = self._select_action(self.params_actor, state[None, ...])
-        return np.array(action[0])
+        action = self._select_action_single(self.params_actor, canonicalize_state(state))
+        return np.array(action)
+
+    @partial(jax.jit, static_argnums=0)
+    def _select_action_single(self, params_actor, state):
+        # Batch and unbatch on device: expand_dims on a traced value is a free view,
+        # whereas state[None, ...] on host copies the observation before the transfer.
+        return self._select_action(params_actor, jnp.expand_dims(state, 0))[0]
 
     @abstractmethod
     def _select_action(self, params_actor, state):
@@ -91,8 +97,13 @@ class OnPolicyActorCritic(ActorCriticMixIn, OnPolicyAlgorithm):
         return self.agent_step % self.buffer_size == 0
 
     def explore(self, state):
-        action, log_pi = self._explore(self.params_actor, state[None, ...], next(self.rng))
-        return np.array(action[0]), np.array(log_pi[0])
+        action, log_pi = self._explore_single(self.params_actor, canonicalize_state(state), next(self.rng))
+        return np.array(action), np.array(log_pi)
+
+    @partial(jax.jit, static_argnums=0)
+    def _explore_single(self, params_actor, state, key):
+        action, log_pi = self._explore(params_actor, jnp.expand_dims(state, 0), key)
+        return action[0], log_pi[0]
 
 
 class OffPolicyActorCritic(ActorCriticMixIn, OffPolicyAlgorithm):
@@ -148,8 +159,18 @@ class OffPolicyActorCritic(ActorCriticMixIn, OffPolicyAlgorithm):
             self.fake_args_actor = (fake_state(state_space),)
 
     def explore(self, state):
-        action = self._explore(self.params_actor, state[None, ...], next(self.rng))
-        return np.array(action[0])
+        action = self._explore_single(self.params_actor, canonicalize_state(state), next(self.rng))
+        return np.array(action)
+
+    @partial(jax.jit, static_argnums=0)
+    def _explore_single(self, params_actor, state, key):
+        return self._explore(params_actor, jnp.expand_dims(state, 0), key)[0]
+
+    def explore_batch(self, state):
+        # The jitted policy is already batched, so a vectorized env's stacked states go
+        # through as-is.
+        action = self._explore(self.params_actor, canonicalize_state(state), next(self.rng))
+        return np.array(action)
 
     @abstractmethod
     def _sample_action(self, params_actor, state, *args, **kwargs):
@@ -7,7 +7,7 @@ from gym.spaces import Box
 from haiku import PRNGSequence
 
 from rljax.buffer import PrioritizedReplayBuffer, ReplayBuffer, RolloutBuffer
-from rljax.util import soft_update
+from rljax.util import canonicalize_state, soft_update
 
 
 class BaseAlgorithm(ABC):
@@ -43,6 +43,8 @@ class BaseAlgorithm(ABC):
         return done if self.episode_step != env._max_episode_steps or self.discrete_action else False
 
     def get_key_list(self, num_keys):
+        # Reserve the keys in bulk, so PRNGSequence does one split instead of num_keys.
+        self.rng.reserve(num_keys)
         return [next(self.rng) for _ in range(num_keys)]
 
     @abstractmethod
@@ -53,6 +55,10 @@ class BaseAlgorithm(ABC):
     def step(self, env, state):
         pass
 
+    def rollout(self, env, state):
+        # By default, a rollout chunk is a single environment step.
+        return self.step(env, state)
+
     @abstractmethod
     def select_action(self, state):
         pass
@@ -134,10 +140,13 @@ class OffPolicyAlgorithm(BaseAlgorithm):
         self.update_interval = update_interval
         self.update_interval_target = update_interval_target
 
+        # soft_update is jitted once at module level with the old target params
+        # donated, so every instance shares one compilation and XLA reuses the target
+        # buffers in place; tau is traced, so binding it with partial doesn't recompile.
         if update_interval_target:
-            self._update_target = jax.jit(partial(soft_update, tau=1.0))
+            self._update_target = partial(soft_update, tau=1.0)
         else:
-            self._update_target = jax.jit(partial(soft_update, tau=tau))
+            self._update_target = partial(soft_update, tau=tau)
 
     def is_update(self):
         return self.agent_step % self.update_interval == 0 and self.agent_step >= self.start_steps
@@ -161,6 +170,119 @@ class OffPolicyAlgorithm(BaseAlgorithm):
 
         return next_state
 
+    def explore_batch(self, state):
+        # Batched exploration for vectorized envs. Subclasses whose jitted policies are
+        # already batched (Q-learning and actor-critic) override this.
+        raise NotImplementedError
+
+    def rollout(self, env, state):
+        if getattr(env, "num_envs", None):
+            return self._rollout_vectorized(env, state)
+
+        # Collect `update_interval` transitions in a single call, so that the whole chunk runs
+        # in one Python frame and the per-step dispatch of the trainer loop is amortized.
+        # NOTE: gym's env.step() is stateful, so the chunk can't be traced into one lax.scan.
+        env_step = env.step
+        explore = self.explore
+        sample_action = env.action_space.sample
+        max_episode_steps = getattr(env, "_max_episode_steps", 0)
+
+        # Reserve one key per step up front; unexplored steps keep theirs queued.
+        if self.agent_step >= self.start_steps:
+            self.rng.reserve(self.update_interval)
+
+        states, actions, next_states = [], [], []
+        rewards = np.empty(self.update_interval, dtype=np.float32)
+        dones = np.empty(self.update_interval, dtype=np.float32)
+        is_timeout = np.empty(self.update_interval, dtype=np.bool_)
+
+        # Double-buffer the policy input: the host-to-device copy of each new state is
+        # dispatched right after the env returns it, so the (asynchronous) transfer
+        # overlaps with the per-step bookkeeping instead of stalling explore().
+        state_dev = jax.device_put(canonicalize_state(state)) if self.agent_step >= self.start_steps else None
+
+        for t in range(self.update_interval):
+            self.agent_step += 1
+            self.episode_step += 1
+
+            if self.agent_step <= self.start_steps:
+                action = sample_action()
+            else:
+                action = explore(state_dev)
+
+            next_state, reward, done, _ = env_step(action)
+            states.append(state)
+            actions.append(action)
+            rewards[t] = reward
+            dones[t] = done
+            is_timeout[t] = self.episode_step == max_episode_steps
+            next_states.append(next_state)
+
+            if done:
+                self.episode_step = 0
+                next_state = env.reset()
+            if self.agent_step >= self.start_steps:
+                state_dev = jax.device_put(canonicalize_state(next_state))
+            state = next_state
+
+        # Vectorized mask bookkeeping over the chunk (cf. get_mask): a timeout is not a
+        # true terminal state for continuous control, so it keeps the bootstrapped value.
+        if self.discrete_action:
+            masks = dones
+        else:
+            masks = np.where(is_timeout, 0.0, dones)
+
+        # Write the whole chunk to the buffer with a single batched append.
+        self.buffer.append_batch(states, actions, rewards, masks, next_states, dones)
+        return state
+
+    def _rollout_vectorized(self, env, state):
+        # Collect num_envs transitions per (parallel) env.step() call, with one batched
+        # explore() and one batched buffer append serving the whole slice. Interleaved
+        # episodes are incompatible with sequential n-step returns.
+        num_envs = env.num_envs
+        assert self.buffer.nstep == 1, "Vectorized rollouts require nstep=1."
+        assert self.update_interval % num_envs == 0 or num_envs % self.update_interval == 0
+
+        # Per-env episode step counters for timeout masking.
+        if not hasattr(self, "_episode_steps"):
+            self._episode_steps = np.zeros(num_envs, dtype=np.int64)
+
+        max_episode_steps = getattr(env, "_max_episode_steps", 0)
+
+        for _ in range(max(self.update_interval // num_envs, 1)):
+            self.agent_step += num_envs
+            self._episode_steps += 1
+
+            if self.agent_step <= self.start_steps:
+                action = env.action_space.sample()
+            else:
+                action = self.explore_batch(state)
+
+            next_state, reward, done, info = env.step(action)
+            done = np.asarray(done, dtype=np.float32)
+
+            # The vector env auto-resets finished envs, so recover the true terminal
+            # observation from info where the wrapper provides it.
+            next_state_store = next_state
+            if done.any():
+                next_state_store = np.array(next_state)
+                for i in np.flatnonzero(done):
+                    terminal_state = info[i].get("terminal_observation")
+                    if terminal_state is not None:
+                        next_state_store[i] = terminal_state
+
+            if self.discrete_action:
+                mask = done
+            else:
+                mask = np.where(self._episode_steps == max_episode_steps, 0.0, done)
+
+            self.buffer.append_batch(state, action, reward, mask, next_state_store, done)
+            self._episode_steps[done > 0.0] = 0
+            state = next_state
+
+        return state
+
 
 class OnPolicyAlgorithm(BaseAlgorithm):
     """
@@ -209,3 +331,28 @@ class OnPolicyAlgorithm(BaseAlgorithm):
             next_state = env.reset()
 
         return next_state
+
+    def rollout(self, env, state):
+        # Collect `buffer_size` transitions in a single call (see OffPolicyAlgorithm.rollout).
+        env_step = env.step
+        explore = self.explore
+        append = self.buffer.append
+
+        # Reserve one exploration key per step with a single split.
+        self.rng.reserve(self.buffer_size)
+
+        for _ in range(self.buffer_size):
+            self.agent_step += 1
+            self.episode_step += 1
+
+            action, log_pi = explore(state)
+            next_state, reward, done, _ = env_step(action)
+            mask = self.get_mask(env, done)
+            append(state, action, reward, mask, log_pi, next_state)
+
+            if done:
+                self.episode_step = 0
+                next_state = env.reset()
+            state = next_state
+
+        return state
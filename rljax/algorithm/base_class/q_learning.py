@@ -1,10 +1,13 @@
 import os
 from abc import abstractmethod
+from functools import partial
 
+import jax
+import jax.numpy as jnp
 import numpy as np
 
 from rljax.algorithm.base_class.base_algoirithm import OffPolicyAlgorithm
-from rljax.util import fake_state, load_params, save_params
+from rljax.util import canonicalize_state, fake_state, load_params, save_params
 
 
 class QLearning(OffPolicyAlgorithm):
@@ -67,23 +70,47 @@ class QLearning(OffPolicyAlgorithm):
             self.num_keys_loss = 0
 
     def select_action(self, state):
-        if np.random.rand() < self.eps_eval:
-            action = self.action_space.sample()
-        else:
-            action = self.forward(state[None, ...])
-            action = np.array(action[0])
-        return action
+        action = self._explore_single(
+            canonicalize_state(state), next(self.rng), self.eps_eval, *self.params_forward, **self.kwargs_forward
+        )
+        return np.array(action)
 
     def explore(self, state):
-        if np.random.rand() < self.eps_train:
-            action = self.action_space.sample()
-        else:
-            action = self.forward(state[None, ...])
-            action = np.array(action[0])
-        return action
+        action = self._explore_single(
+            canonicalize_state(state), next(self.rng), self.eps_train, *self.params_forward, **self.kwargs_forward
+        )
+        return np.array(action)
+
+    @partial(jax.jit, static_argnums=0)
+    def _explore_single(self, state, key, eps, *params, **kwargs):
+        # Batch and unbatch on device: expand_dims on a traced value is a free view,
+        # whereas state[None, ...] on host copies the observation before the transfer.
+        return self._explore(jnp.expand_dims(state, 0), key, eps, *params, **kwargs)[0]
+
+    def explore_batch(self, state):
+        # The jitted epsilon-greedy is already batched, so a vectorized env's stacked
+        # states go through as-is.
+        action = self._explore(
+            canonicalize_state(state), next(self.rng), self.eps_train, *self.params_forward, **self.kwargs_forward
+        )
+        return np.array(action)
 
     def forward(self, state):
-        return self._forward(self.params, state, **self.kwargs_forward)
+        return self._forward(*self.params_forward, state, **self.kwargs_forward)
+
+    @partial(jax.jit, static_argnums=0)
+    def _explore(self, state, key, eps, *params, **kwargs):
+        # Branchless epsilon-greedy: compute greedy and random actions on device and
+        # select, instead of branching on a host-side np.random.rand() per step. eps is
+        # traced, so the decay schedule doesn't trigger recompilation.
+        greedy_action = self._forward(*params, state, **kwargs)
+        key_action, key_choice = jax.random.split(key)
+        random_action = jax.random.randint(key_action, greedy_action.shape, 0, self.action_space.n)
+        return jnp.where(jax.random.uniform(key_choice, greedy_action.shape) < eps, random_action, greedy_action)
+
+    @property
+    def params_forward(self):
+        return (self.params,)
 
     @abstractmethod
     def _forward(self, params, state, *args, **kwargs):
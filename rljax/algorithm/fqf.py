@@ -91,8 +91,9 @@ class FQF(QRDQN):
         opt_init, self.opt_cum_p = optix.rmsprop(lr_cum_p, decay=0.95, eps=1e-5, centered=True)
         self.opt_state_cum_p = opt_init(self.params_cum_p)
 
-    def forward(self, state):
-        return self._forward(self.params_cum_p, self.params, state)
+    @property
+    def params_forward(self):
+        return (self.params_cum_p, self.params)
 
     @partial(jax.jit, static_argnums=0)
     def _forward(
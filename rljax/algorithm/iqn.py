@@ -42,6 +42,7 @@ class IQN(QRDQN):
         num_quantiles=64,
         num_quantiles_eval=32,
         num_cosines=64,
+        fixed_cum_p_eval=False,
     ):
         if fn is None:
 
@@ -54,7 +55,7 @@ class IQN(QRDQN):
                 )(s, cum_p)
 
         if not hasattr(self, "fake_args"):
-            self.fake_args = (fake_state(state_space), np.empty((1, num_quantiles), dtype=np.float32))
+            self.fake_args = (fake_state(state_space), np.zeros((1, num_quantiles), dtype=np.float32))
         if not hasattr(self, "use_key_forward"):
             self.use_key_forward = True
         if not hasattr(self, "num_keys_loss"):
@@ -86,6 +87,12 @@ class IQN(QRDQN):
             num_quantiles=num_quantiles,
         )
         self.num_quantiles_eval = num_quantiles_eval
+        # Optionally select actions on the fixed midpoint grid instead of sampled
+        # quantiles. The grid enters the jitted forward as a constant, so XLA folds
+        # cos(cum_p * pi) at compile time and the greedy step skips the transcendental.
+        self.fixed_cum_p_eval = fixed_cum_p_eval
+        if fixed_cum_p_eval:
+            self.cum_p_eval = jnp.array((np.arange(num_quantiles_eval, dtype=np.float32) + 0.5) / num_quantiles_eval)
 
     @partial(jax.jit, static_argnums=0)
     def _forward(
@@ -94,7 +101,10 @@ class IQN(QRDQN):
         state: np.ndarray,
         key: jnp.ndarray,
     ) -> jnp.ndarray:
-        cum_p = jax.random.uniform(key, (state.shape[0], self.num_quantiles_eval))
+        if self.fixed_cum_p_eval:
+            cum_p = jnp.tile(self.cum_p_eval, (state.shape[0], 1))
+        else:
+            cum_p = jax.random.uniform(key, (state.shape[0], self.num_quantiles_eval))
         return jnp.argmax(self.net.apply(params, state, cum_p).mean(axis=1), axis=1)
 
     @partial(jax.jit, static_argnums=0)
@@ -80,7 +80,6 @@ class PPO(OnPolicyActorCritic):
         self.clip_eps = clip_eps
         self.lambd = lambd
         self.max_grad_norm = max_grad_norm
-        self.idxes = np.arange(buffer_size)
 
     @partial(jax.jit, static_argnums=0)
     def _select_action(
@@ -113,39 +112,75 @@ class PPO(OnPolicyActorCritic):
             next_state=next_state,
         )
 
-        for _ in range(self.epoch_ppo):
-            np.random.shuffle(self.idxes)
-            for start in range(0, self.buffer_size, self.batch_size):
-                self.learning_step += 1
-                idx = self.idxes[start : start + self.batch_size]
-
-                # Update critic.
-                self.opt_state_critic, self.params_critic, loss_critic, _ = optimize(
-                    self._loss_critic,
-                    self.opt_critic,
-                    self.opt_state_critic,
-                    self.params_critic,
-                    self.max_grad_norm,
-                    state=state[idx],
-                    target=target[idx],
-                )
-
-                # Update actor.
-                self.opt_state_actor, self.params_actor, loss_actor, _ = optimize(
-                    self._loss_actor,
-                    self.opt_actor,
-                    self.opt_state_actor,
-                    self.params_actor,
-                    self.max_grad_norm,
-                    state=state[idx],
-                    action=action[idx],
-                    log_pi_old=log_pi_old[idx],
-                    gae=gae[idx],
-                )
+        # One shuffled pass over the buffer per epoch. Stacking all minibatch index sets
+        # lets the whole epoch_ppo x num_batches loop run as a single jitted scan, so the
+        # two gradient kernels are launched once per update instead of once per minibatch.
+        idxes = np.stack([np.random.permutation(self.buffer_size) for _ in range(self.epoch_ppo)])
+        idxes = idxes.reshape(-1, self.batch_size)
+        self.learning_step += idxes.shape[0]
+
+        carry, (loss_critic, loss_actor) = self._update_steps(
+            self.opt_state_critic,
+            self.params_critic,
+            self.opt_state_actor,
+            self.params_actor,
+            idxes=idxes,
+            state=state,
+            action=action,
+            log_pi_old=log_pi_old,
+            gae=gae,
+            target=target,
+        )
+        self.opt_state_critic, self.params_critic, self.opt_state_actor, self.params_actor = carry
 
         if writer:
-            writer.add_scalar("loss/critic", loss_critic, self.learning_step)
-            writer.add_scalar("loss/actor", loss_actor, self.learning_step)
+            writer.add_scalar("loss/critic", loss_critic[-1], self.learning_step)
+            writer.add_scalar("loss/actor", loss_actor[-1], self.learning_step)
+
+    @partial(jax.jit, static_argnums=0)
+    def _update_steps(
+        self,
+        opt_state_critic,
+        params_critic: hk.Params,
+        opt_state_actor,
+        params_actor: hk.Params,
+        idxes: np.ndarray,
+        state: np.ndarray,
+        action: np.ndarray,
+        log_pi_old: np.ndarray,
+        gae: jnp.ndarray,
+        target: jnp.ndarray,
+    ):
+        def _step(carry, idx):
+            opt_state_critic, params_critic, opt_state_actor, params_actor = carry
+
+            # Update critic.
+            opt_state_critic, params_critic, loss_critic, _ = optimize(
+                self._loss_critic,
+                self.opt_critic,
+                opt_state_critic,
+                params_critic,
+                self.max_grad_norm,
+                state=state[idx],
+                target=target[idx],
+            )
+
+            # Update actor.
+            opt_state_actor, params_actor, loss_actor, _ = optimize(
+                self._loss_actor,
+                self.opt_actor,
+                opt_state_actor,
+                params_actor,
+                self.max_grad_norm,
+                state=state[idx],
+                action=action[idx],
+                log_pi_old=log_pi_old[idx],
+                gae=gae[idx],
+            )
+            return (opt_state_critic, params_critic, opt_state_actor, params_actor), (loss_critic, loss_actor)
+
+        carry = (opt_state_critic, params_critic, opt_state_actor, params_actor)
+        return jax.lax.scan(_step, carry, idxes)
 
     @partial(jax.jit, static_argnums=0)
     def _loss_critic(
@@ -132,7 +132,8 @@ class SAC_AE(SAC):
         self.opt_state_critic = opt_init(self.params_entire_critic)
 
         # Other parameters.
-        self._update_target_ae = jax.jit(partial(soft_update, tau=tau_ae))
+        # soft_update is jitted with donation at module level; see OffPolicyAlgorithm's _update_target.
+        self._update_target_ae = partial(soft_update, tau=tau_ae)
         self.lambda_latent = lambda_latent
         self.lambda_weight = lambda_weight
         self.update_interval_actor = update_interval_actor
@@ -140,14 +141,33 @@ class SAC_AE(SAC):
         self.update_interval_target = update_interval_target
 
     def select_action(self, state):
-        last_conv = self._preprocess(self.params_encoder, state[None, ...])
-        action = self._select_action(self.params_actor, last_conv)
-        return np.array(action[0])
+        action = self._select_action_single(self.params_encoder, self.params_actor, state)
+        return np.array(action)
 
     def explore(self, state):
-        last_conv = self._preprocess(self.params_encoder, state[None, ...])
-        action = self._explore(self.params_actor, last_conv, next(self.rng))
-        return np.array(action[0])
+        action = self._explore_single(self.params_encoder, self.params_actor, state, next(self.rng))
+        return np.array(action)
+
+    def explore_batch(self, state):
+        # Unlike the base actor-critic override, the stacked observations have to go
+        # through the encoder before they reach the (batched) policy.
+        action = self._explore_batch(self.params_encoder, self.params_actor, state, next(self.rng))
+        return np.array(action)
+
+    @partial(jax.jit, static_argnums=0)
+    def _select_action_single(self, params_encoder, params_actor, state):
+        # Batch and unbatch inside jit, so the raw observation is transferred as-is.
+        last_conv = self._preprocess(params_encoder, jnp.expand_dims(state, 0))
+        return self._select_action(params_actor, last_conv)[0]
+
+    @partial(jax.jit, static_argnums=0)
+    def _explore_single(self, params_encoder, params_actor, state, key):
+        last_conv = self._preprocess(params_encoder, jnp.expand_dims(state, 0))
+        return self._explore(params_actor, last_conv, key)[0]
+
+    @partial(jax.jit, static_argnums=0)
+    def _explore_batch(self, params_encoder, params_actor, state, key):
+        return self._explore(params_actor, self._preprocess(params_encoder, state), key)
 
     @partial(jax.jit, static_argnums=0)
     def _preprocess(
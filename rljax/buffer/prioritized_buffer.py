@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import jax
@@ -26,6 +28,7 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         min_pa=0.0,
         max_pa=1.0,
         eps=0.01,
+        dtype=np.float32,
     ):
         super(PrioritizedReplayBuffer, self).__init__(
             buffer_size=buffer_size,
@@ -33,6 +36,7 @@ class PrioritizedReplayBuffer(ReplayBuffer):
             action_space=action_space,
             gamma=gamma,
             nstep=nstep,
+            dtype=dtype,
         )
 
         self.alpha = alpha
@@ -42,6 +46,15 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         self.max_pa = max_pa
         self.eps = eps
         self._cached_idxes = None
+        # The segment trees are refreshed by a background worker, overlapping the
+        # host-side scan with the next rollout. The lock serializes tree writes from
+        # the worker with concurrent appends; slots recycled while a refresh is
+        # pending are recorded so the worker doesn't clobber a fresh transition's
+        # max priority with the stale value computed for the slot's previous occupant.
+        self._tree_lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1)
+        self._refresh_future = None
+        self._overwritten_idxes = set()
 
         tree_size = 1
         while tree_size < buffer_size:
@@ -51,10 +64,23 @@ class PrioritizedReplayBuffer(ReplayBuffer):
 
     def _append(self, state, action, reward, next_state, done):
         # Assign max priority when stored for the first time.
-        self.tree_min[self._p] = self.max_pa
-        self.tree_sum[self._p] = self.max_pa
+        with self._tree_lock:
+            if self._refresh_future is not None:
+                self._overwritten_idxes.add(self._p)
+            self.tree_min[self._p] = self.max_pa
+            self.tree_sum[self._p] = self.max_pa
         super()._append(state, action, reward, next_state, done)
 
+    def _append_batch(self, state, action, reward, done, next_state):
+        # Assign max priority when stored for the first time.
+        with self._tree_lock:
+            for idx in (self._p + np.arange(len(reward))) % self.buffer_size:
+                if self._refresh_future is not None:
+                    self._overwritten_idxes.add(idx)
+                self.tree_min[idx] = self.max_pa
+                self.tree_sum[idx] = self.max_pa
+        super()._append_batch(state, action, reward, done, next_state)
+
     def _sample_idx(self, batch_size):
         total_pa = self.tree_sum.reduce(0, self._n)
         rand = np.random.rand(batch_size) * total_pa
@@ -65,10 +91,13 @@ class PrioritizedReplayBuffer(ReplayBuffer):
     def sample(self, batch_size):
         assert self._cached_idxes is None, "Update priorities before sampling."
 
+        # Sampling reads the trees, so any pending refresh has to land first.
+        self._wait_priority_refresh()
         self._cached_idxes = self._sample_idx(batch_size)
         weight = self._calculate_weight(self._cached_idxes)
         batch = self._sample(self._cached_idxes)
-        return weight, batch
+        # Stage weight and minibatch on device with a single transfer.
+        return jax.device_put((weight, batch))
 
     def _calculate_weight(self, idxes):
         min_pa = self.tree_min.reduce(0, self._n)
@@ -80,11 +109,27 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         assert self._cached_idxes is not None, "Sample batch before updating priorities."
         assert abs_td.shape[1:] == (1,)
         pa = np.array(self._calculate_pa(abs_td), dtype=np.float32).flatten()
-        for i, idx in enumerate(self._cached_idxes):
-            self.tree_sum[idx] = pa[i]
-            self.tree_min[idx] = pa[i]
+        # Refresh the trees in the background, overlapping the O(batch * log n)
+        # host-side scan with the next rollout chunk.
+        self._refresh_future = self._refresh_executor.submit(self._refresh_priority, self._cached_idxes, pa)
         self._cached_idxes = None
 
+    def _refresh_priority(self, idxes, pa):
+        with self._tree_lock:
+            for i, idx in enumerate(idxes):
+                # The slot was recycled after this priority was computed.
+                if idx in self._overwritten_idxes:
+                    continue
+                self.tree_sum[idx] = pa[i]
+                self.tree_min[idx] = pa[i]
+
+    def _wait_priority_refresh(self):
+        if self._refresh_future is not None:
+            self._refresh_future.result()
+            self._refresh_future = None
+            with self._tree_lock:
+                self._overwritten_idxes.clear()
+
     @partial(jax.jit, static_argnums=0)
     def _calculate_pa(self, abs_td: jnp.ndarray) -> jnp.ndarray:
         return jnp.clip((abs_td + self.eps) ** self.alpha, self.min_pa, self.max_pa)
@@ -1,2 +1,3 @@
 from .atari import make_atari_env
 from .continuous import make_continuous_env
+from .vector import make_vec_env
@@ -0,0 +1,25 @@
+import gym
+
+
+class TerminalObservationEnv(gym.Wrapper):
+    """
+    Stash the final observation of an episode in info["terminal_observation"], since
+    gym's vector env workers auto-reset on done and discard it otherwise.
+    """
+
+    def step(self, action):
+        state, reward, done, info = self.env.step(action)
+        if done:
+            info["terminal_observation"] = state
+        return state, reward, done, info
+
+
+def make_vec_env(env_id, num_envs):
+    """
+    Make a vectorized env, which simulates num_envs copies of env_id in parallel worker
+    processes and steps all of them with a single batched step() call.
+    """
+    env = gym.vector.AsyncVectorEnv([lambda: TerminalObservationEnv(gym.make(env_id)) for _ in range(num_envs)])
+    # Expose the episode length of the underlying env for timeout masking.
+    env._max_episode_steps = gym.spec(env_id).max_episode_steps
+    return env
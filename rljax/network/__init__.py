@@ -1,5 +1,5 @@
 from .actor import CategoricalPolicy, DeterministicPolicy, StateDependentGaussianPolicy, StateIndependentGaussianPolicy
-from .base import MLP
+from .base import MLP, BatchedMLP
 from .conv import DQNBody, SACDecoder, SACEncoder, SLACDecoder, SLACEncoder
 from .critic import (
     ContinuousQFunction,
@@ -34,3 +34,68 @@ class MLP(hk.Module):
         if self.output_activation is not None:
             x = self.output_activation(x)
         return x
+
+
+class BatchedLinear(hk.Module):
+    """
+    Linear layer with per-member parameters, applied to a stack of inputs.
+    """
+
+    def __init__(self, output_size, w_init=None):
+        super(BatchedLinear, self).__init__()
+        self.output_size = output_size
+        self.w_init = w_init
+
+    def __call__(self, x):
+        num_parallel, _, input_size = x.shape
+        # Initialize each member independently, then stack along the ensemble axis.
+        w_init = self.w_init
+
+        def _stacked_init(shape, dtype):
+            return jnp.stack([w_init(shape[1:], dtype) for _ in range(shape[0])])
+
+        w = hk.get_parameter("w", (num_parallel, input_size, self.output_size), init=_stacked_init)
+        b = hk.get_parameter("b", (num_parallel, 1, self.output_size), init=jnp.zeros)
+        return jnp.matmul(x, w) + b
+
+
+class BatchedMLP(hk.Module):
+    """
+    Ensemble of MLPs evaluated as one batched matmul per layer, instead of one
+    independent subgraph per ensemble member.
+    """
+
+    def __init__(
+        self,
+        num_parallel,
+        output_dim,
+        hidden_units,
+        hidden_activation=nn.relu,
+        output_activation=None,
+        hidden_scale=1.0,
+        output_scale=1.0,
+        d2rl=False,
+    ):
+        super(BatchedMLP, self).__init__()
+        self.num_parallel = num_parallel
+        self.output_dim = output_dim
+        self.hidden_units = hidden_units
+        self.hidden_activation = hidden_activation
+        self.output_activation = output_activation
+        self.d2rl = d2rl
+        self.hidden_w_init = hk.initializers.Orthogonal(scale=hidden_scale)
+        self.output_w_init = hk.initializers.Orthogonal(scale=output_scale)
+
+    def __call__(self, x):
+        # (batch, input_dim) -> (num_parallel, batch, output_dim).
+        x = jnp.broadcast_to(x, (self.num_parallel,) + x.shape)
+        x_input = x
+        for i, unit in enumerate(self.hidden_units):
+            x = BatchedLinear(unit, w_init=self.hidden_w_init)(x)
+            x = self.hidden_activation(x)
+            if self.d2rl and i + 1 != len(self.hidden_units):
+                x = jnp.concatenate([x, x_input], axis=-1)
+        x = BatchedLinear(self.output_dim, w_init=self.output_w_init)(x)
+        if self.output_activation is not None:
+            x = self.output_activation(x)
+        return x
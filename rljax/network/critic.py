@@ -1,14 +1,29 @@
 import math
+from functools import lru_cache
 
 import haiku as hk
 import jax.numpy as jnp
 import numpy as np
 from jax import nn
 
-from rljax.network.base import MLP
+from rljax.network.base import MLP, BatchedMLP
 from rljax.network.conv import DQNBody
 
 
+def _dueling_output(output, baseline):
+    # Fold the dueling residual into one expression: taking (baseline - mean) first keeps
+    # the intermediate at baseline's (..., 1) shape instead of materializing a second
+    # full-size output, and XLA fuses the whole head into a single kernel under jit.
+    return output + (baseline - jnp.mean(output, axis=-1, keepdims=True))
+
+
+@lru_cache(maxsize=None)
+def _cosine_pi(num_cosines):
+    # hk.transform re-instantiates modules on every trace, so cache the constant
+    # per num_cosines instead of materializing it in every __init__.
+    return math.pi * jnp.arange(1, num_cosines + 1, dtype=jnp.float32).reshape(1, 1, num_cosines)
+
+
 class ContinuousVFunction(hk.Module):
     """
     Critic for PPO.
@@ -24,16 +39,17 @@ class ContinuousVFunction(hk.Module):
         self.hidden_units = hidden_units
 
     def __call__(self, x):
-        def _fn(x):
-            return MLP(
-                1,
-                self.hidden_units,
-                hidden_activation=jnp.tanh,
-            )(x)
+        # Evaluate the ensemble as one batched matmul per layer.
+        output = BatchedMLP(
+            self.num_critics,
+            1,
+            self.hidden_units,
+            hidden_activation=jnp.tanh,
+        )(x)
 
         if self.num_critics == 1:
-            return _fn(x)
-        return [_fn(x) for _ in range(self.num_critics)]
+            return output[0]
+        return list(output)
 
 
 class ContinuousQFunction(hk.Module):
@@ -53,18 +69,19 @@ class ContinuousQFunction(hk.Module):
         self.d2rl = d2rl
 
     def __call__(self, s, a):
-        def _fn(x):
-            return MLP(
+        x = jnp.concatenate([s, a], axis=1)
+        # Evaluate the ensemble as one batched matmul per layer.
+        # Return list even if num_critics == 1 for simple implementation.
+        return list(
+            BatchedMLP(
+                self.num_critics,
                 1,
                 self.hidden_units,
                 hidden_activation=nn.relu,
                 hidden_scale=np.sqrt(2),
                 d2rl=self.d2rl,
             )(x)
-
-        x = jnp.concatenate([s, a], axis=1)
-        # Return list even if num_critics == 1 for simple implementation.
-        return [_fn(x) for _ in range(self.num_critics)]
+        )
 
 
 class ContinuousQuantileFunction(hk.Module):
@@ -86,17 +103,18 @@ class ContinuousQuantileFunction(hk.Module):
         self.d2rl = d2rl
 
     def __call__(self, s, a):
-        def _fn(x):
-            return MLP(
+        x = jnp.concatenate([s, a], axis=1)
+        # Evaluate the ensemble as one batched matmul per layer.
+        return list(
+            BatchedMLP(
+                self.num_critics,
                 self.num_quantiles,
                 self.hidden_units,
                 hidden_activation=nn.relu,
                 hidden_scale=np.sqrt(2),
                 d2rl=self.d2rl,
             )(x)
-
-        x = jnp.concatenate([s, a], axis=1)
-        return [_fn(x) for _ in range(self.num_critics)]
+        )
 
 
 class DiscreteQFunction(hk.Module):
@@ -118,9 +136,12 @@ class DiscreteQFunction(hk.Module):
         self.dueling_net = dueling_net
 
     def __call__(self, x):
+        # Compute the conv trunk once and share it across the ensemble; only the MLP
+        # heads have per-critic parameters.
+        if len(x.shape) == 4:
+            x = DQNBody()(x)
+
         def _fn(x):
-            if len(x.shape) == 4:
-                x = DQNBody()(x)
             output = MLP(
                 self.action_space.n,
                 self.hidden_units,
@@ -134,7 +155,7 @@ class DiscreteQFunction(hk.Module):
                     hidden_activation=nn.relu,
                     hidden_scale=np.sqrt(2),
                 )(x)
-                return output + baseline - output.mean(axis=1, keepdims=True)
+                return _dueling_output(output, baseline)
             else:
                 return output
 
@@ -164,9 +185,12 @@ class DiscreteQuantileFunction(hk.Module):
         self.dueling_net = dueling_net
 
     def __call__(self, x):
+        # Compute the conv trunk once and share it across the ensemble; only the MLP
+        # heads have per-critic parameters.
+        if len(x.shape) == 4:
+            x = DQNBody()(x)
+
         def _fn(x):
-            if len(x.shape) == 4:
-                x = DQNBody()(x)
             output = MLP(
                 self.action_space.n * self.num_quantiles,
                 self.hidden_units,
@@ -182,7 +206,7 @@ class DiscreteQuantileFunction(hk.Module):
                     hidden_scale=np.sqrt(2),
                 )(x)
                 baseline = baseline.reshape(-1, self.num_quantiles, 1)
-                return output + baseline - output.mean(axis=2, keepdims=True)
+                return _dueling_output(output, baseline)
             else:
                 return output
 
@@ -210,20 +234,23 @@ class DiscreteImplicitQuantileFunction(hk.Module):
         self.num_cosines = num_cosines
         self.hidden_units = hidden_units
         self.dueling_net = dueling_net
-        self.pi = math.pi * jnp.arange(1, num_cosines + 1, dtype=jnp.float32).reshape(1, 1, num_cosines)
+        self.pi = _cosine_pi(num_cosines)
 
     def __call__(self, x, cum_p):
-        def _fn(x, cum_p):
-            if len(x.shape) == 4:
-                x = DQNBody()(x)
-
-            # NOTE: For IQN and FQF, number of quantiles are variable.
-            feature_dim = x.shape[1]
-            num_quantiles = cum_p.shape[1]
-            # Calculate features.
-            cosine = jnp.cos(jnp.expand_dims(cum_p, 2) * self.pi).reshape(-1, self.num_cosines)
-            cosine_feature = nn.relu(hk.Linear(feature_dim)(cosine)).reshape(-1, num_quantiles, feature_dim)
-            x = (x.reshape(-1, 1, feature_dim) * cosine_feature).reshape(-1, feature_dim)
+        # Compute the conv trunk and the cosine embedding once and share them across
+        # the ensemble; only the MLP heads have per-critic parameters.
+        if len(x.shape) == 4:
+            x = DQNBody()(x)
+
+        # NOTE: For IQN and FQF, number of quantiles are variable.
+        feature_dim = x.shape[1]
+        num_quantiles = cum_p.shape[1]
+        # Calculate features.
+        cosine = jnp.cos(jnp.expand_dims(cum_p, 2) * self.pi).reshape(-1, self.num_cosines)
+        cosine_feature = nn.relu(hk.Linear(feature_dim)(cosine)).reshape(-1, num_quantiles, feature_dim)
+        x = (x.reshape(-1, 1, feature_dim) * cosine_feature).reshape(-1, feature_dim)
+
+        def _fn(x):
             # Apply quantile network.
             output = MLP(
                 self.action_space.n,
@@ -240,10 +267,10 @@ class DiscreteImplicitQuantileFunction(hk.Module):
                     hidden_scale=np.sqrt(2),
                 )(x)
                 baseline = baseline.reshape(-1, num_quantiles, 1)
-                return output + baseline - output.mean(axis=2, keepdims=True)
+                return _dueling_output(output, baseline)
             else:
                 return output
 
         if self.num_critics == 1:
-            return _fn(x, cum_p)
-        return [_fn(x, cum_p) for _ in range(self.num_critics)]
+            return _fn(x)
+        return [_fn(x) for _ in range(self.num_critics)]
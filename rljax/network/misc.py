@@ -8,6 +8,7 @@ from jax import nn
 
 from rljax.network.base import MLP
 from rljax.network.conv import DQNBody, SLACDecoder, SLACEncoder
+from rljax.util.input import fake_state
 
 
 class CumProbNetwork(hk.Module):
@@ -37,9 +38,7 @@ def make_quantile_nerwork(
     """
     Make Quantile Nerwork for FQF.
     """
-    fake_state = state_space.sample()[None, ...]
-    if len(state_space.shape) == 1:
-        fake_state = fake_state.astype(np.float32)
+    probe_state = fake_state(state_space)
     network_dict = {}
     params_dict = {}
 
@@ -48,10 +47,10 @@ def make_quantile_nerwork(
         fake_feature = np.zeros((1, 7 * 7 * 64), dtype=np.float32)
     else:
         network_dict["feature"] = hk.without_apply_rng(hk.transform(lambda s: s))
-        fake_feature = fake_state
-    params_dict["feature"] = network_dict["feature"].init(next(rng), fake_state)
+        fake_feature = probe_state
+    params_dict["feature"] = network_dict["feature"].init(next(rng), probe_state)
 
-    fake_cum_p = np.empty((1, num_quantiles), dtype=np.float32)
+    fake_cum_p = np.zeros((1, num_quantiles), dtype=np.float32)
     network_dict["quantile"] = hk.without_apply_rng(hk.transform(fn))
     params_dict["quantile"] = network_dict["quantile"].init(next(rng), fake_feature, fake_cum_p)
 
@@ -57,16 +57,21 @@ class Trainer:
         # Initialize the environment.
         state = self.env.reset()
 
-        for step in range(1, self.num_agent_steps + 1):
-            state = self.algo.step(self.env, state)
+        # Next agent step to evaluate at.
+        next_eval = self.eval_interval
+
+        while self.algo.agent_step < self.num_agent_steps:
+            # Collect a whole chunk of transitions per call.
+            state = self.algo.rollout(self.env, state)
 
             if self.algo.is_update():
                 self.algo.update(self.writer)
 
-            if step % self.eval_interval == 0:
-                self.evaluate(step)
+            if self.algo.agent_step >= next_eval:
+                self.evaluate(self.algo.agent_step)
                 if self.save_params:
-                    self.algo.save_params(os.path.join(self.param_dir, f"step{step}"))
+                    self.algo.save_params(os.path.join(self.param_dir, f"step{self.algo.agent_step}"))
+                next_eval += self.eval_interval
 
         # Wait for the logging to be finished.
         sleep(2)
@@ -6,7 +6,7 @@ from .distribution import (
     reparameterize_gaussian,
     reparameterize_gaussian_and_tanh,
 )
-from .input import fake_action, fake_state
+from .input import canonicalize_state, fake_action, fake_state
 from .loss import huber, quantile_loss
 from .optim import clip_gradient, clip_gradient_norm, optimize, soft_update, weight_decay
 from .preprocess import add_noise, get_q_at_action, get_quantile_at_action, preprocess_state
@@ -1,17 +1,37 @@
+import jax.numpy as jnp
 import numpy as np
 from gym.spaces import Box
 
 
 def fake_state(state_space):
-    state = state_space.sample()[None, ...]
-    if len(state_space.shape) == 1:
+    """
+    Make a deterministic probe input for network initialization and the first jit
+    trace. Zeros with the canonical dtype avoid drawing the space's RNG, so the probe
+    (and thus the initial trace) doesn't depend on the env seed.
+    """
+    dtype = np.uint8 if len(state_space.shape) == 3 else np.float32
+    return np.zeros((1, *state_space.shape), dtype=dtype)
+
+
+def canonicalize_state(state):
+    """
+    Cast float64 observations (e.g. from MuJoCo envs) to float32 before they cross the
+    jit boundary, so that a single executable serves every call site and the
+    host-to-device transfer moves half the bytes.
+    """
+    if isinstance(state, jnp.ndarray):
+        # Already canonicalized and staged on device (e.g. by the rollout's double
+        # buffering); np.asarray would force a device-to-host sync here.
+        return state
+    state = np.asarray(state)
+    if state.dtype == np.float64:
         state = state.astype(np.float32)
     return state
 
 
 def fake_action(action_space):
     if type(action_space) == Box:
-        action = action_space.sample().astype(np.float32)[None, ...]
+        action = np.zeros((1, *action_space.shape), dtype=np.float32)
     else:
         NotImplementedError
     return action
@@ -59,7 +59,7 @@ def clip_gradient_norm(
     return jax.tree_map(lambda g: _clip_gradient_norm(g), grad)
 
 
-@jax.jit
+@partial(jax.jit, donate_argnums=(0,))
 def soft_update(
     target_params: hk.Params,
     online_params: hk.Params,
@@ -67,6 +67,10 @@ def soft_update(
 ) -> hk.Params:
     """
     Update target network using Polyak-Ruppert Averaging.
+
+    The old target params are donated, so XLA reuses their buffers for the output in
+    place; every caller rebinds the result over them. tau is traced (a weak-typed
+    scalar), so all instances and taus share this one compilation.
     """
     return jax.tree_multimap(lambda t, s: (1 - tau) * t + tau * s, target_params, online_params)
 
@@ -15,6 +15,20 @@ def _test_algorithm(env, algo):
 
         state = _state
 
+    # Test rollout() method, which the trainer drives instead of step().
+    agent_step = algo.agent_step
+    num_stored = algo.buffer._n
+    state = algo.rollout(env, state)
+    assert env.observation_space.contains(np.array(state))
+    num_steps = algo.agent_step - agent_step
+    assert num_steps > 0
+    if getattr(algo.buffer, "nstep", 1) == 1:
+        # Every transition of the chunk is appended, with a binary (possibly
+        # timeout-masked) done flag.
+        assert algo.buffer._n == min(num_stored + num_steps, algo.buffer.buffer_size)
+        for i in range(num_stored, algo.buffer._n):
+            assert float(algo.buffer.done[i]) in (0.0, 1.0)
+
     # Test is_update() method.
     assert isinstance(algo.is_update(), bool)
 
@@ -8,13 +8,13 @@ from ._test_algorithm import _test_algorithm
 
 @pytest.mark.slow
 @pytest.mark.parametrize(
-    "use_per, dueling_net, double_q",
+    "use_per, dueling_net, double_q, fixed_cum_p_eval",
     [
-        (False, False, False),
-        (True, True, True),
+        (False, False, False, False),
+        (True, True, True, True),
     ],
 )
-def test_iqn(use_per, dueling_net, double_q):
+def test_iqn(use_per, dueling_net, double_q, fixed_cum_p_eval):
     env = gym.make("CartPole-v0")
     algo = IQN(
         num_agent_steps=100000,
@@ -26,5 +26,6 @@ def test_iqn(use_per, dueling_net, double_q):
         use_per=use_per,
         dueling_net=dueling_net,
         double_q=double_q,
+        fixed_cum_p_eval=fixed_cum_p_eval,
     )
     _test_algorithm(env, algo)
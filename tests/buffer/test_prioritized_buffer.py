@@ -8,8 +8,8 @@ from rljax.buffer.prioritized_buffer import PrioritizedReplayBuffer
 @pytest.mark.parametrize(
     "env_id, state_dtype, state_shape, action_dtype, action_shape",
     [
-        ("CartPole-v0", np.float32, (4,), np.int32, (1,)),
-        ("MsPacmanNoFrameskip-v4", np.uint8, (210, 160, 3), np.int32, (1,)),
+        ("CartPole-v0", np.float32, (4,), np.uint8, (1,)),
+        ("MsPacmanNoFrameskip-v4", np.uint8, (210, 160, 3), np.uint8, (1,)),
         ("Pendulum-v0", np.float32, (3,), np.float32, (1,)),
     ],
 )
@@ -59,12 +59,42 @@ def test_prioritized_buffer(env_id, state_dtype, state_shape, action_dtype, acti
         abs_td = np.random.rand(1, 1).astype(np.float32)
         abs_td_target = np.clip((abs_td + 0.01) ** 0.6, 0.0, 1.0)
         buffer.update_priority(abs_td)
+        # Priorities are refreshed in the background.
+        buffer._wait_priority_refresh()
 
         for i, idx in enumerate(idxes):
             assert np.isclose(buffer.tree_sum[idx], abs_td_target[i, 0])
             assert np.isclose(buffer.tree_min[idx], abs_td_target[i, 0])
 
 
+def test_priority_refresh_skips_recycled_slots():
+    env = gym.make("CartPole-v0")
+    buffer = PrioritizedReplayBuffer(
+        1,
+        env.observation_space,
+        env.action_space,
+        gamma=0.99,
+        nstep=1,
+        alpha=0.6,
+        beta=0.4,
+        beta_steps=4,
+        min_pa=0.0,
+        max_pa=1.0,
+        eps=0.01,
+    )
+    state = env.observation_space.sample()
+
+    buffer.append(state, env.action_space.sample(), 1.0, False, state)
+    buffer.sample(1)
+    buffer.update_priority(np.zeros((1, 1), dtype=np.float32))
+    # The slot is recycled while the refresh may still be pending; the stale
+    # near-zero priority must not clobber the fresh transition's max priority.
+    buffer.append(state, env.action_space.sample(), 1.0, False, state)
+    buffer._wait_priority_refresh()
+    assert np.isclose(buffer.tree_sum[0], 1.0)
+    assert np.isclose(buffer.tree_min[0], 1.0)
+
+
 def test_calculate_pa():
     env = gym.make("CartPole-v0")
     buffer = PrioritizedReplayBuffer(
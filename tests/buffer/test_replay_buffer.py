@@ -34,8 +34,8 @@ def test_nstep_buffer():
 @pytest.mark.parametrize(
     "env_id, state_dtype, state_shape, action_dtype, action_shape",
     [
-        ("CartPole-v0", np.float32, (4,), np.int32, (1,)),
-        ("MsPacmanNoFrameskip-v4", np.uint8, (210, 160, 3), np.int32, (1,)),
+        ("CartPole-v0", np.float32, (4,), np.uint8, (1,)),
+        ("MsPacmanNoFrameskip-v4", np.uint8, (210, 160, 3), np.uint8, (1,)),
         ("Pendulum-v0", np.float32, (3,), np.float32, (1,)),
     ],
 )
@@ -70,3 +70,59 @@ def test_replay_buffer(env_id, state_dtype, state_shape, action_dtype, action_sh
     assert r.shape == (3, 1)
     assert d.shape == (3, 1)
     assert n_s.shape == (3,) + state_shape and n_s.dtype == state_dtype
+
+
+def test_half_precision_buffer():
+    env = gym.make("Pendulum-v0")
+    buffer = ReplayBuffer(5, env.observation_space, env.action_space, gamma=0.99, nstep=1, dtype=np.float16)
+    state = np.stack([env.observation_space.sample() for _ in range(6)], axis=0).astype(np.float32)
+    action = np.stack([env.action_space.sample() for _ in range(5)], axis=0).astype(np.float32)
+    reward = np.random.rand(5, 1).astype(np.float32)
+    done = np.random.rand(5, 1) < 0.5
+
+    for i in range(5):
+        buffer.append(state[i], action[i], reward[i, 0], done[i, 0], state[i + 1])
+        assert np.isclose(buffer.state[i], state[i], atol=1e-2).all()
+
+    w, (s, a, r, d, n_s) = buffer.sample(3)
+    # Transitions are dequantized to float32 on sampling.
+    assert s.dtype == np.float32
+    assert a.dtype == np.float32
+    assert r.dtype == np.float32
+    assert d.dtype == np.float32
+    assert n_s.dtype == np.float32
+
+
+@pytest.mark.parametrize(
+    "env_id, state_dtype, state_shape, action_dtype, action_shape",
+    [
+        ("CartPole-v0", np.float32, (4,), np.uint8, (1,)),
+        ("Pendulum-v0", np.float32, (3,), np.float32, (1,)),
+    ],
+)
+def test_append_batch(env_id, state_dtype, state_shape, action_dtype, action_shape):
+    env = gym.make(env_id)
+    buffer = ReplayBuffer(5, env.observation_space, env.action_space, gamma=0.99, nstep=1)
+    state = np.stack([env.observation_space.sample() for _ in range(8)], axis=0).astype(state_dtype)
+    action = np.stack([env.action_space.sample() for _ in range(7)], axis=0).astype(action_dtype)
+    reward = np.random.rand(7, 1).astype(np.float32)
+    done = np.random.rand(7, 1) < 0.5
+
+    buffer.append_batch(state[:3], action[:3], reward[:3, 0], done[:3, 0], state[1:4])
+    assert buffer._p == 3 and buffer._n == 3
+    for i in range(3):
+        assert np.isclose(buffer.state[i], state[i]).all()
+        assert np.isclose(buffer.action[i], action[i]).all()
+        assert np.isclose(buffer.reward[i], reward[i]).all()
+        assert np.isclose(float(buffer.done[i]), done[i]).all()
+        assert np.isclose(buffer.next_state[i], state[i + 1]).all()
+
+    # Writes wrap around the end of the buffer.
+    buffer.append_batch(state[3:7], action[3:7], reward[3:7, 0], done[3:7, 0], state[4:8])
+    assert buffer._p == 2 and buffer._n == 5
+    for i in range(3, 7):
+        assert np.isclose(buffer.state[i % 5], state[i]).all()
+        assert np.isclose(buffer.action[i % 5], action[i]).all()
+        assert np.isclose(buffer.reward[i % 5], reward[i]).all()
+        assert np.isclose(float(buffer.done[i % 5]), done[i]).all()
+        assert np.isclose(buffer.next_state[i % 5], state[i + 1]).all()
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from rljax.algorithm.dqn import DQN
+from rljax.env.vector import make_vec_env
+
+
+def test_make_vec_env():
+    env = make_vec_env("CartPole-v0", 2)
+    assert env.num_envs == 2
+    assert env._max_episode_steps == 200
+
+    state = env.reset()
+    assert state.shape == (2, 4)
+
+    next_state, reward, done, info = env.step(env.action_space.sample())
+    assert next_state.shape == (2, 4)
+    assert reward.shape == (2,)
+    assert done.shape == (2,)
+
+
+def test_terminal_observation():
+    env = make_vec_env("CartPole-v0", 2)
+    env.seed(0)
+    env.reset()
+
+    # Random CartPole episodes end well within the 200-step limit.
+    for _ in range(200):
+        next_state, _, done, info = env.step(env.action_space.sample())
+        for i in np.flatnonzero(done):
+            # The worker auto-resets on done, so next_state[i] is the reset
+            # observation and the true final one is recovered from info.
+            terminal_state = info[i]["terminal_observation"]
+            assert terminal_state.shape == next_state[i].shape
+        if done.any():
+            return
+    pytest.fail("No episode ended.")
+
+
+@pytest.mark.slow
+def test_vectorized_rollout():
+    env = make_vec_env("CartPole-v0", 2)
+    env.seed(0)
+    algo = DQN(
+        num_agent_steps=100000,
+        state_space=env.single_observation_space,
+        action_space=env.single_action_space,
+        seed=0,
+        batch_size=4,
+        start_steps=2,
+    )
+
+    state = env.reset()
+    for _ in range(3):
+        agent_step = algo.agent_step
+        num_stored = algo.buffer._n
+        state = algo.rollout(env, state)
+        assert state.shape == (2, 4)
+        num_steps = algo.agent_step - agent_step
+        assert num_steps == algo.update_interval
+        assert algo.buffer._n == min(num_stored + num_steps, algo.buffer.buffer_size)
+
+    algo.update()
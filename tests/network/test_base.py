@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 from jax import nn
 
-from rljax.network.base import MLP
+from rljax.network.base import MLP, BatchedMLP
 
 
 @pytest.mark.parametrize(
@@ -36,3 +36,33 @@ def test_mlp(input_dim, output_dim, hidden_units, hidden_activation, output_acti
     params = net.init(next(hk.PRNGSequence(0)), x)
     y = net.apply(params, x)
     assert y.shape == (1, output_dim)
+
+
+@pytest.mark.parametrize(
+    "num_parallel, input_dim, output_dim, hidden_units, d2rl",
+    [
+        (1, 5, 1, (256,), False),
+        (2, 5, 1, (256, 256), False),
+        (5, 5, 25, (256, 256), True),
+    ],
+)
+def test_batched_mlp(num_parallel, input_dim, output_dim, hidden_units, d2rl):
+    net = hk.without_apply_rng(
+        hk.transform(
+            lambda x: BatchedMLP(
+                num_parallel=num_parallel,
+                output_dim=output_dim,
+                hidden_units=hidden_units,
+                hidden_activation=nn.relu,
+                hidden_scale=np.sqrt(2),
+                d2rl=d2rl,
+            )(x)
+        )
+    )
+    x = np.random.rand(3, input_dim).astype(np.float32)
+    params = net.init(next(hk.PRNGSequence(0)), x)
+    y = net.apply(params, x)
+    assert y.shape == (num_parallel, 3, output_dim)
+    # Members are initialized independently, so their outputs differ.
+    if num_parallel > 1:
+        assert not np.isclose(np.array(y[0]), np.array(y[1])).all()
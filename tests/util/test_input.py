@@ -2,7 +2,7 @@ import gym
 import numpy as np
 
 from rljax.env import make_atari_env
-from rljax.util.input import fake_action, fake_state
+from rljax.util.input import canonicalize_state, fake_action, fake_state
 
 
 def test_pixel_state():
@@ -19,6 +19,17 @@ def test_vector_state():
     assert state.dtype == np.float32
 
 
+def test_canonicalize_state():
+    state = np.random.rand(4).astype(np.float64)
+    assert canonicalize_state(state).dtype == np.float32
+
+    state = np.random.rand(4).astype(np.float32)
+    assert canonicalize_state(state) is state
+
+    state = np.random.randint(0, 255, (84, 84, 4), dtype=np.uint8)
+    assert canonicalize_state(state).dtype == np.uint8
+
+
 def test_fake_action():
     env = gym.make("Pendulum-v0")
     action = fake_action(env.action_space)